@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-16 12:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(fields=['category', 'faction', 'name'], name='products_pr_categor_84a788_idx'),
+        ),
+    ]
@@ -72,6 +72,9 @@ class Product(models.Model):
 
     class Meta:
         ordering = ['name']
+        indexes = [
+            models.Index(fields=['category', 'faction', 'name']),
+        ]
 
     def __str__(self):
         return self.name
@@ -2,21 +2,74 @@
 Base scraper class. Each retailer gets its own subclass.
 """
 
+import codecs
+import datetime
+import hashlib
 import logging
+import random
+import re
+import statistics
+import threading
 import time
-from decimal import Decimal
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from decimal import ROUND_HALF_UP, Decimal
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
+from urllib.robotparser import RobotFileParser
 
 import requests
+from bs4 import BeautifulSoup
+from bs4.dammit import EncodingDetector
+from requests.adapters import HTTPAdapter
 from django.conf import settings
+from django.db import transaction
+from django.db.models import F
 from django.utils import timezone
+from django.utils.text import slugify
 
 from prices.models import CurrentPrice, PriceHistory
 from products.models import Product, Retailer
 
-from .models import ScrapeJob
+from .cache import ResponseCache
+from .models import RequestCount, ScrapeJob
+from .throttle import CircuitBreaker, TokenBucket
 
 logger = logging.getLogger(__name__)
 
+# lxml's C parser is several times faster than the pure-Python html.parser
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+# Likewise orjson for JSON-LD payloads
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+# The number inside scraped price text such as "$1,049.99" or "£30", which
+# must use comma thousands separators and a point for decimals
+PRICE_RE = re.compile(r'\d[\d.,]*\d|\d')
+PRICE_FORMAT_RE = re.compile(r'\d{1,3}(?:,\d{3})+(?:\.\d+)?|\d+(?:\.\d+)?')
+# Digits grouped with spaces ("1 049,99 €", "1\u00a0049.99"), which the number
+# match would otherwise stop short of
+SPACED_DIGITS_RE = re.compile(r'[ \u00a0\u2009\u202f]\d')
+# A minus sign before the number, possibly ahead of a currency symbol
+NEGATIVE_RE = re.compile(r'-[^\w\s]?\s*$')
+WHITESPACE_RE = re.compile(r'\s+')
+CHARSET_RE = re.compile(r'charset=["\']?([\w.:-]+)', re.IGNORECASE)
+CENT = Decimal('0.01')
+
+# Responses worth another attempt: rate limiting and transient server errors
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Parsed robots.txt per (origin, user agent), shared by every scraper in the process
+_ROBOTS_CACHE = {}
+_ROBOTS_LOCK = threading.Lock()
+
 
 class BaseScraper:
     """
@@ -32,6 +85,11 @@ class BaseScraper:
         }
     """
     retailer_slug: str = ''
+    circuit_threshold: int = 5  # consecutive failures before a host is skipped
+    circuit_cooldown: int = 60  # seconds before a skipped host is retried
+    min_timeout: float = 3  # floor for the latency-based request timeout
+    latency_window: int = 200  # recent response times kept per host
+    latency_min_samples: int = 20  # responses seen before the timeout adapts
 
     def __init__(self):
         self.session = requests.Session()
@@ -39,6 +97,38 @@ class BaseScraper:
             settings, 'SCRAPER_USER_AGENT', 'Thrifthammer/1.0'
         )
         self.delay = getattr(settings, 'SCRAPER_REQUEST_DELAY', 2)
+        self.burst = getattr(settings, 'SCRAPER_REQUEST_BURST', 1)
+        self.timeout = getattr(settings, 'SCRAPER_REQUEST_TIMEOUT', 15)
+        self.max_response_bytes = getattr(settings, 'SCRAPER_MAX_RESPONSE_BYTES', 0)
+        self.max_workers = getattr(settings, 'SCRAPER_MAX_WORKERS', 4)
+        self.max_retries = getattr(settings, 'SCRAPER_MAX_RETRIES', 3)
+        self.max_backoff = getattr(settings, 'SCRAPER_MAX_BACKOFF', 30)
+        self.daily_request_limit = getattr(settings, 'SCRAPER_DAILY_REQUEST_LIMIT', 0)
+        self.respect_robots = getattr(settings, 'SCRAPER_RESPECT_ROBOTS', True)
+        # Scraped items buffered per DB write, and rows per bulk INSERT/UPDATE
+        self.batch_size = getattr(settings, 'SCRAPER_BATCH_SIZE', 100)
+
+        # One rate limiter and circuit breaker per host, shared by all threads
+        self._buckets = {}
+        self._breakers = {}
+        self._latencies = defaultdict(lambda: deque(maxlen=self.latency_window))
+        self._hosts_lock = threading.Lock()
+
+        cache_dir = getattr(settings, 'SCRAPER_HTTP_CACHE_DIR', '')
+        self.response_cache = ResponseCache(cache_dir) if cache_dir else None
+
+        # Keep-alive connections are reused across requests; size the pool to
+        # the worker count so concurrent fetches don't block waiting for a
+        # free connection. Retries are handled in fetch(), not by urllib3.
+        # requests already sends Connection: keep-alive and advertises every
+        # Accept-Encoding urllib3 can decode, so those headers are left alone.
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=max(self.max_workers, 10),
+            max_retries=0,
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
 
     def get_retailer(self):
         return Retailer.objects.get(slug=self.retailer_slug)
@@ -48,24 +138,28 @@ class BaseScraper:
         retailer = self.get_retailer()
         job = ScrapeJob.objects.create(retailer=retailer, status='running', started_at=timezone.now())
         errors = []
+        pending = []
 
         try:
+            self._load_product_index()
             for item in self.scrape_products():
                 job.products_found += 1
                 try:
-                    self._update_price(retailer, item)
-                    job.prices_updated += 1
+                    pending.append(self._clean_item(item))
                 except Exception as exc:
                     errors.append(f"{item.get('name', '?')}: {exc}")
-                    logger.exception("Error updating price for %s", item.get('name'))
-                time.sleep(self.delay)
+                    logger.exception("Error reading scraped item %s", item.get('name'))
+                if len(pending) >= self.batch_size:
+                    self._flush(retailer, job, pending, errors)
 
+            self._flush(retailer, job, pending, errors)
             job.status = 'success'
         except Exception as exc:
             job.status = 'failed'
             errors.append(str(exc))
             logger.exception("Scrape job failed for %s", retailer.name)
         finally:
+            self.session.close()
             job.errors = '\n'.join(errors)
             job.finished_at = timezone.now()
             job.save()
@@ -76,39 +170,558 @@ class BaseScraper:
         """Yield product dicts. Override in subclasses."""
         raise NotImplementedError
 
+    def fetch(self, url):
+        """
+        GET a page and return its body, or None if the request failed.
+
+        Timeouts, connection errors, 429s and 5xx responses are retried with
+        jittered exponential backoff, honouring Retry-After (up to
+        SCRAPER_MAX_BACKOFF) when the server sends one.
+        With SCRAPER_HTTP_CACHE_DIR set, pages are revalidated with a
+        conditional GET and served from disk on 304 Not Modified. A host that
+        keeps failing is skipped for a while (see CircuitBreaker). Once a host
+        has answered a few times, the timeout tracks its observed p95 instead
+        of the fixed SCRAPER_REQUEST_TIMEOUT.
+        Bodies longer than SCRAPER_MAX_RESPONSE_BYTES are cut short rather
+        than read into memory in full.
+        """
+        allowed = self.allowed_by_robots(url)
+        if allowed is None:
+            logger.warning("robots.txt unavailable for %s; skipping %s", urlsplit(url).netloc, url)
+            return None
+        if not allowed:
+            logger.warning("robots.txt disallows %s", url)
+            return None
+
+        bucket = self._bucket_for(url)
+        breaker = self._breaker_for(url)
+        for attempt in range(self.max_retries + 1):
+            if not breaker.allow():
+                logger.warning("Too many failures from %s; skipping %s", urlsplit(url).netloc, url)
+                return None
+            if not self._reserve_request():
+                breaker.release()
+                logger.warning("Daily request limit reached for %s; skipping %s", self.retailer_slug, url)
+                return None
+            wait = None
+            headers = self.response_cache.conditional_headers(url) if self.response_cache else {}
+            timeout = self._timeout_for(url)
+            bucket.acquire()
+            try:
+                response = self.session.get(url, timeout=timeout, headers=headers, stream=True)
+            except (requests.Timeout, requests.ConnectionError) as exc:
+                breaker.record_failure()
+                if isinstance(exc, requests.Timeout):
+                    # Count the timeout as a slow response so the limit grows
+                    # back if the host has genuinely slowed down
+                    self._record_latency(url, timeout)
+                error = exc
+            except requests.RequestException as exc:
+                breaker.record_failure()
+                logger.warning("Request failed for %s: %s", url, exc)
+                return None
+            else:
+                with response:
+                    if response.status_code not in RETRY_STATUSES:
+                        breaker.record_success()
+                        self._record_latency(url, response.elapsed.total_seconds())
+                        if response.status_code == 304 and headers:
+                            return self.response_cache.load(url)
+                        if not response.ok:
+                            logger.warning("Request failed for %s: HTTP %s", url, response.status_code)
+                            return None
+                        try:
+                            body, truncated = self._read_body(response)
+                        except requests.RequestException as exc:
+                            logger.warning("Request failed for %s: %s", url, exc)
+                            return None
+                        if truncated:
+                            logger.info("Truncated %s at %d bytes", url, self.max_response_bytes)
+                        elif self.response_cache:
+                            self.response_cache.store(url, response, body)
+                        return body
+                    breaker.record_failure()
+                    error = f'HTTP {response.status_code}'
+                    wait = self._retry_after(response)
+
+            if attempt < self.max_retries:
+                if wait is None:
+                    wait = self._backoff(attempt)
+                    logger.info("Retrying %s in %.1fs (%s)", url, wait, error)
+                    time.sleep(wait)
+                else:
+                    # The server asked us to slow down: hold back every thread
+                    wait = min(wait, self.max_backoff)
+                    logger.info("Retrying %s in %.1fs (%s, Retry-After)", url, wait, error)
+                    bucket.pause(wait)
+
+        logger.warning("Request failed for %s after %d attempts: %s", url, self.max_retries + 1, error)
+        return None
+
+    def _read_body(self, response):
+        """
+        Read a streamed response, stopping once SCRAPER_MAX_RESPONSE_BYTES
+        have arrived. Returns (text, truncated).
+        """
+        buf = bytearray()
+        truncated = False
+        for chunk in response.iter_content(65536):
+            buf += chunk
+            if self.max_response_bytes and len(buf) > self.max_response_bytes:
+                del buf[self.max_response_bytes:]
+                truncated = True
+                break
+        return self._decode(response, bytes(buf)), truncated
+
     @staticmethod
-    def _update_price(retailer, item):
-        """Upsert CurrentPrice and append PriceHistory."""
-        price = Decimal(str(item['price']))
-
-        # Try matching by SKU first, then name
-        product = None
-        if item.get('sku'):
-            product = Product.objects.filter(gw_sku=item['sku']).first()
-        if not product:
-            product = Product.objects.filter(name__iexact=item['name']).first()
-        if not product:
-            # Auto-create if not found
-            from django.utils.text import slugify
-            product = Product.objects.create(
-                name=item['name'],
-                slug=slugify(item['name'])[:300],
-                gw_sku=item.get('sku', ''),
-            )
+    def _decode(response, body):
+        """
+        Decode a page with the charset from its Content-Type header, else its
+        <meta charset>, else UTF-8, falling back to Windows-1252.
+
+        requests assumes ISO-8859-1 for any text/* response without a
+        charset, which garbles UTF-8 pages, so response.encoding isn't used.
+        """
+        match = CHARSET_RE.search(response.headers.get('Content-Type', ''))
+        declared = EncodingDetector.find_declared_encoding(body, is_html=True)
+        for encoding in (match and match.group(1), declared):
+            if encoding:
+                try:
+                    return body.decode(encoding, errors='replace')
+                except LookupError:
+                    pass  # Unknown charset name; keep looking
+        try:
+            # Incremental, so a character split by truncation isn't an error
+            return codecs.getincrementaldecoder('utf-8')().decode(body)
+        except UnicodeDecodeError:
+            return body.decode('cp1252', errors='replace')
+
+    def _bucket_for(self, url):
+        """Rate limiter for the host serving `url`."""
+        host = urlsplit(url).netloc
+        with self._hosts_lock:
+            if host not in self._buckets:
+                rate = 1 / self.delay if self.delay else 0
+                self._buckets[host] = TokenBucket(rate, capacity=self.burst)
+            return self._buckets[host]
+
+    def _breaker_for(self, url):
+        """Circuit breaker for the host serving `url`."""
+        host = urlsplit(url).netloc
+        with self._hosts_lock:
+            if host not in self._breakers:
+                self._breakers[host] = CircuitBreaker(self.circuit_threshold, self.circuit_cooldown)
+            return self._breakers[host]
+
+    def _record_latency(self, url, seconds):
+        with self._hosts_lock:
+            self._latencies[urlsplit(url).netloc].append(seconds)
+
+    def _timeout_for(self, url):
+        """
+        Timeout for the next request to `url`'s host: 1.5x its recent p95
+        response time, between min_timeout and SCRAPER_REQUEST_TIMEOUT.
+        """
+        with self._hosts_lock:
+            samples = list(self._latencies[urlsplit(url).netloc])
+        if len(samples) < self.latency_min_samples:
+            return self.timeout
+        p95 = statistics.quantiles(samples, n=20)[18]
+        return min(self.timeout, max(self.min_timeout, p95 * 1.5))
+
+    def allowed_by_robots(self, url):
+        """
+        Check `url` against its host's robots.txt (cached per host).
+
+        Returns None if robots.txt couldn't be fetched, so callers can tell
+        an unreachable host from one that forbids the page.
+        """
+        if not self.respect_robots:
+            return True
+        parts = urlsplit(url)
+        rules = self._robots_rules(f'{parts.scheme}://{parts.netloc}')
+        if rules is None:
+            return None
+        return rules.can_fetch(self.session.headers['User-Agent'], url)
+
+    def _robots_rules(self, origin):
+        """
+        Fetch and parse an origin's robots.txt through the scraper's session.
+
+        Parsed rules are kept for the rest of the process. Returns None if
+        robots.txt couldn't be fetched; that isn't cached, so it's retried on
+        the next check (subject to the host's rate limit and circuit breaker).
+        """
+        key = (origin, self.session.headers['User-Agent'])
+        with _ROBOTS_LOCK:
+            if key in _ROBOTS_CACHE:
+                return _ROBOTS_CACHE[key]
+
+        breaker = self._breaker_for(origin)
+        if not breaker.allow():
+            return None
+        self._bucket_for(origin).acquire()
+        try:
+            response = self.session.get(f'{origin}/robots.txt', timeout=self.timeout)
+        except requests.RequestException:
+            breaker.record_failure()
+            return None
+        if response.status_code in RETRY_STATUSES or response.status_code >= 500:
+            breaker.record_failure()
+            return None
+        breaker.record_success()
+
+        # Same status handling as RobotFileParser.read()
+        rules = RobotFileParser(f'{origin}/robots.txt')
+        if response.status_code in (401, 403):
+            rules.disallow_all = True
+        elif response.status_code >= 400:
+            rules.allow_all = True
+        else:
+            rules.parse(response.text.splitlines())
+        with _ROBOTS_LOCK:
+            _ROBOTS_CACHE[key] = rules
+        return rules
+
+    def fetch_many(self, urls, workers=None):
+        """
+        Fetch several pages concurrently and return {url: body}.
+
+        Fetching is network-bound, so a thread pool overlaps the waits.
+        Duplicate URLs are fetched once; failed pages map to None.
+        """
+        urls = list(dict.fromkeys(urls))
+        with ThreadPoolExecutor(max_workers=workers or self.max_workers) as pool:
+            return dict(zip(urls, pool.map(self.fetch, urls)))
+
+    def iter_pages(self, urls, workers=None):
+        """
+        Fetch pages concurrently, yielding (url, body) as each one completes.
+
+        Lets a scraper parse and yield items while later requests are still
+        in flight; DB writes stay on the thread consuming scrape_products().
+        Duplicate URLs are fetched once. If the caller stops early, fetches
+        that haven't started yet are cancelled.
+        """
+        pool = ThreadPoolExecutor(max_workers=workers or self.max_workers)
+        try:
+            futures = {pool.submit(self.fetch, url): url for url in dict.fromkeys(urls)}
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    @staticmethod
+    def soup(html, parse_only=None):
+        """
+        Parse HTML with the fastest available BeautifulSoup parser.
+
+        Pass a SoupStrainer as `parse_only` to build only the parts of the
+        page the scraper reads, which saves both time and memory.
+        """
+        return BeautifulSoup(html, HTML_PARSER, parse_only=parse_only)
+
+    @staticmethod
+    def select_first(soup, selectors):
+        """
+        Return the first element matched by any of `selectors`, tried in order.
 
-        CurrentPrice.objects.update_or_create(
-            product=product,
-            retailer=retailer,
-            defaults={
-                'price': price,
-                'url': item['url'],
-                'in_stock': item.get('in_stock', True),
-            },
+        Pass selectors precompiled with soupsieve.compile() at module level so
+        they aren't re-parsed on every page.
+        """
+        for selector in selectors:
+            match = selector.select_one(soup)
+            if match is not None:
+                return match
+        return None
+
+    @staticmethod
+    def iter_ld_json(soup, contains=None):
+        """
+        Yield every JSON-LD node on a parsed page, flattening lists and @graph.
+
+        Walk this once per page and pick out sku, offers, etc. in the same
+        pass rather than re-scanning the scripts for each field. Scripts whose
+        raw text lacks `contains` (e.g. '"Product"') are skipped unparsed.
+        """
+        for script in soup.find_all('script', type='application/ld+json'):
+            raw = str(script.string or '')
+            if contains and contains not in raw:
+                continue
+            try:
+                data = json_loads(raw)
+            except ValueError:
+                continue
+            stack = [data]
+            while stack:
+                node = stack.pop()
+                if isinstance(node, list):
+                    stack.extend(reversed(node))
+                elif isinstance(node, dict):
+                    if isinstance(node.get('@graph'), list):
+                        stack.extend(reversed(node['@graph']))
+                    yield node
+
+    def _reserve_request(self):
+        """
+        Count one request against the retailer's daily budget.
+
+        The counter is a RequestCount row, so the total is shared by every
+        process and survives between runs. Returns False once the budget is
+        spent.
+        """
+        if not self.daily_request_limit:
+            return True
+        counter, _ = RequestCount.objects.get_or_create(
+            retailer_slug=self.retailer_slug, day=timezone.localdate(),
+        )
+        # A conditional UPDATE, so concurrent scrapers can't overspend
+        return bool(
+            RequestCount.objects
+            .filter(pk=counter.pk, count__lt=self.daily_request_limit)
+            .update(count=F('count') + 1)
         )
 
-        PriceHistory.objects.create(
-            product=product,
-            retailer=retailer,
-            price=price,
-            in_stock=item.get('in_stock', True),
+    def _backoff(self, attempt):
+        """
+        Seconds to sleep before retry number `attempt` (0-based).
+
+        Exponential with full jitter, so concurrent workers retrying the same
+        struggling host spread out instead of retrying in lockstep.
+        """
+        ceiling = min(self.max_backoff, max(self.delay, 1) * 2 ** attempt)
+        return random.uniform(0, ceiling)
+
+    @staticmethod
+    def _retry_after(response):
+        """Seconds to wait according to a Retry-After header, or None."""
+        value = response.headers.get('Retry-After')
+        if not value:
+            return None
+        if value.isdigit():
+            return int(value)
+        try:
+            when = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if timezone.is_naive(when):
+            when = when.replace(tzinfo=datetime.timezone.utc)
+        return max(0, (when - timezone.now()).total_seconds())
+
+    def _flush(self, retailer, job, pending, errors):
+        """
+        Save the buffered items in one transaction and empty the buffer.
+
+        The job's counters are written in the same transaction, so the
+        dashboard shows a running job's progress once per batch.
+        """
+        if not pending:
+            return
+        try:
+            with transaction.atomic():
+                self._save_prices(retailer, pending)
+                ScrapeJob.objects.filter(pk=job.pk).update(
+                    products_found=job.products_found,
+                    prices_updated=job.prices_updated + len(pending),
+                )
+            job.prices_updated += len(pending)
+        except Exception as exc:
+            errors.extend(f"{item['name']}: {exc}" for item in pending)
+            logger.exception("Error saving %d prices for %s", len(pending), retailer.name)
+            # Products created by the rolled-back batch no longer exist
+            self._load_product_index()
+        pending.clear()
+
+    @staticmethod
+    def parse_price(value):
+        """
+        Convert a scraped price ("$1,049.99", "30", 30.0) to a 2dp Decimal.
+
+        Raises ValueError for negative prices, for text using a comma as the
+        decimal separator ("30,00 €"), which can't be told apart from a
+        thousands separator reliably, and for space-separated thousands.
+        """
+        # Numbers from JSON-LD or APIs don't need the str/regex round trip
+        number = Decimal(repr(value)) if type(value) is float else value
+        if (isinstance(number, Decimal) and number.is_finite()) or type(number) is int:
+            if number < 0:
+                raise ValueError(f'Negative price in {value!r}')
+            if type(number) is int:
+                return Decimal(number * 100).scaleb(-2)
+            return number.quantize(CENT, rounding=ROUND_HALF_UP)
+
+        text = str(value)
+        match = PRICE_RE.search(text)
+        if not match:
+            raise ValueError(f'No price found in {value!r}')
+        if NEGATIVE_RE.search(text, 0, match.start()):
+            raise ValueError(f'Negative price in {value!r}')
+        if not PRICE_FORMAT_RE.fullmatch(match.group()) or SPACED_DIGITS_RE.match(text, match.end()):
+            raise ValueError(f'Unrecognised price format in {value!r}')
+
+        # Work in integer cents and build a single Decimal at the end
+        whole, _, frac = match.group().replace(',', '').partition('.')
+        cents = int(whole) * 100 + int(frac[:2].ljust(2, '0'))
+        if frac[2:3] >= '5':
+            cents += 1
+        return Decimal(cents).scaleb(-2)
+
+    @classmethod
+    def _clean_item(cls, item):
+        """
+        Normalise a scraped item dict, raising if it's unusable.
+
+        Values that wouldn't fit their columns are rejected here, so one bad
+        item can't make the database refuse the whole batch it's saved in.
+        """
+        cleaned = {
+            'name': WHITESPACE_RE.sub(' ', item['name']).strip(),
+            'sku': item.get('sku') or '',
+            'price': cls.parse_price(item['price']),
+            'url': item['url'],
+            'in_stock': item.get('in_stock', True),
+        }
+        for key, field in (
+            ('name', Product._meta.get_field('name')),
+            ('sku', Product._meta.get_field('gw_sku')),
+            ('url', CurrentPrice._meta.get_field('url')),
+        ):
+            if len(cleaned[key]) > field.max_length:
+                raise ValueError(f'{key} is longer than {field.max_length} characters')
+
+        price_field = CurrentPrice._meta.get_field('price')
+        if cleaned['price'] >= 10 ** (price_field.max_digits - price_field.decimal_places):
+            raise ValueError(f"Price {cleaned['price']} is too large")
+        return cleaned
+
+    def _save_prices(self, retailer, items):
+        """Upsert CurrentPrice and append PriceHistory for a batch of items."""
+        products = self._match_products(items)
+        now = timezone.now()
+
+        # The last listing wins if a product shows up twice in one batch; an
+        # upsert can't touch the same row twice in one statement anyway
+        latest = {}
+        for item, product in zip(items, products):
+            if product.pk in latest and latest[product.pk][1]['url'] != item['url']:
+                logger.warning(
+                    "%s and %s both matched product %r; keeping the later price",
+                    latest[product.pk][1]['url'], item['url'], product.name,
+                )
+            latest[product.pk] = (product, item)
+
+        # One INSERT ... ON CONFLICT DO UPDATE covers new and existing rows
+        CurrentPrice.objects.bulk_create(
+            [
+                CurrentPrice(
+                    product_id=product.pk,
+                    retailer_id=retailer.pk,
+                    price=item['price'],
+                    url=item['url'],
+                    in_stock=item['in_stock'],
+                    last_seen=now,
+                )
+                for product, item in latest.values()
+            ],
+            batch_size=self.batch_size,
+            update_conflicts=True,
+            unique_fields=['product', 'retailer'],
+            update_fields=['price', 'url', 'in_stock', 'last_seen'],
         )
+
+        PriceHistory.objects.bulk_create([
+            PriceHistory(
+                product_id=product.pk,
+                retailer_id=retailer.pk,
+                price=item['price'],
+                in_stock=item['in_stock'],
+            )
+            for item, product in zip(items, products)
+        ], batch_size=self.batch_size)
+
+    @staticmethod
+    def _name_key(name):
+        """Case- and whitespace-insensitive lookup key for a product name."""
+        return WHITESPACE_RE.sub(' ', name).strip().casefold()
+
+    @classmethod
+    def _slug_for(cls, name):
+        """
+        Slug for an auto-created product. Names with no ASCII letters or
+        digits slugify to '', so those get a hash of the name instead.
+        """
+        slug = slugify(name)[:300]
+        if not slug:
+            digest = hashlib.blake2b(cls._name_key(name).encode(), digest_size=6).hexdigest()
+            slug = f'product-{digest}'
+        return slug
+
+    def _load_product_index(self):
+        """
+        Map SKUs and case-folded names to products for the whole run, so
+        matching scraped items doesn't need queries per batch.
+        """
+        self._products_by_sku = {}
+        self._products_by_name = {}
+        # Only the fields used for matching; the index lives for the whole run
+        for product in Product.objects.only('id', 'name', 'gw_sku'):
+            if product.gw_sku:
+                self._products_by_sku.setdefault(product.gw_sku, product)
+            self._products_by_name.setdefault(self._name_key(product.name), product)
+
+    def _match_products(self, items):
+        """
+        Return the Product for each item, matching by SKU first, then name.
+
+        Unmatched items get a new Product, inserted in one query per batch.
+        If its slug belongs to a product with a different SKU, the SKU is
+        appended to keep them apart; any other slug clash resolves to the
+        product already holding it rather than failing the whole batch.
+        """
+        by_sku = self._products_by_sku
+        by_name = self._products_by_name
+
+        # Auto-create if not found
+        new = {}
+        new_skus = set()  # so two listings sharing a new SKU get one product
+        for item in items:
+            key = self._name_key(item['name'])
+            sku = item['sku']
+            if sku in by_sku or sku in new_skus or key in by_name or key in new:
+                continue
+            if sku:
+                new_skus.add(sku)
+            new[key] = Product(
+                name=item['name'],
+                slug=self._slug_for(item['name']),
+                gw_sku=sku,
+            )
+        if new:
+            # One query for every slug this batch wants, instead of one per product
+            claimed = dict(
+                Product.objects.filter(slug__in=[product.slug for product in new.values()])
+                .values_list('slug', 'gw_sku')
+            )
+            for product in new.values():
+                other_sku = claimed.get(product.slug)
+                if product.gw_sku and other_sku and other_sku != product.gw_sku:
+                    # Trim the base, not the suffix, so long slugs stay distinct
+                    suffix = f'-{self._slug_for(product.gw_sku)}'
+                    product.slug = product.slug[:300 - len(suffix)].rstrip('-') + suffix
+                claimed.setdefault(product.slug, product.gw_sku)
+
+            # ignore_conflicts leaves pks unset, so read the rows back by slug
+            Product.objects.bulk_create(new.values(), batch_size=self.batch_size, ignore_conflicts=True)
+            saved = Product.objects.only('id', 'name', 'gw_sku', 'slug').in_bulk(
+                [product.slug for product in new.values()], field_name='slug',
+            )
+            new = {key: saved[product.slug] for key, product in new.items()}
+        by_name.update(new)
+        for product in new.values():
+            if product.gw_sku:
+                by_sku.setdefault(product.gw_sku, product)
+
+        return [
+            by_sku.get(item['sku']) or by_name[self._name_key(item['name'])]
+            for item in items
+        ]
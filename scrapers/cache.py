@@ -0,0 +1,75 @@
+"""
+On-disk cache of fetched pages for conditional GETs.
+
+Bodies are stored alongside their ETag / Last-Modified validators so reruns
+can send If-None-Match / If-Modified-Since and reuse the cached copy when the
+server answers 304 Not Modified. Files are written atomically, so
+concurrent fetches never read a half-written page.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+
+
+class ResponseCache:
+    def __init__(self, directory):
+        self.directory = Path(directory)
+
+    def _paths(self, url):
+        name = hashlib.blake2b(url.encode(), digest_size=16).hexdigest()
+        return self.directory / f'{name}.html', self.directory / f'{name}.meta.json'
+
+    def conditional_headers(self, url):
+        """Validator headers for a cached copy of `url`, or {} if there is none."""
+        body_path, meta_path = self._paths(url)
+        if not body_path.exists():
+            return {}
+        try:
+            meta = json.loads(meta_path.read_text())
+        except (OSError, ValueError):
+            return {}
+
+        headers = {}
+        if meta.get('etag'):
+            headers['If-None-Match'] = meta['etag']
+        if meta.get('last_modified'):
+            headers['If-Modified-Since'] = meta['last_modified']
+        return headers
+
+    def load(self, url):
+        """Return the cached body for `url`, or None if it has gone missing."""
+        body_path, _ = self._paths(url)
+        try:
+            return body_path.read_text(encoding='utf-8')
+        except OSError:
+            return None
+
+    def store(self, url, response, body):
+        """Cache the body of a 200 response if the server sent any validators."""
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if not (etag or last_modified):
+            return
+
+        body_path, meta_path = self._paths(url)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._write(body_path, body)
+        self._write(meta_path, json.dumps({
+            'url': url,
+            'etag': etag,
+            'last_modified': last_modified,
+        }))
+
+    def _write(self, path, text):
+        """Write via a temporary file and rename it into place."""
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(text)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
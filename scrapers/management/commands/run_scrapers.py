@@ -4,13 +4,27 @@ Management command to run price scrapers.
 Usage:
     python manage.py run_scrapers                 # run all active scrapers
     python manage.py run_scrapers example-store    # run a specific scraper
+    python manage.py run_scrapers --batch-size 500 # save prices in larger batches
+    python manage.py run_scrapers --parallel 3     # scrape 3 retailers at once
 """
 
+import argparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
 from django.core.management.base import BaseCommand
+from django.db import connections
 
 from scrapers.registry import SCRAPER_REGISTRY
 
 
+def positive_int(value):
+    """argparse type for options that must be 1 or more."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f'must be at least 1, not {value}')
+    return number
+
+
 class Command(BaseCommand):
     help = 'Run price scrapers for Warhammer retailers'
 
@@ -20,9 +34,21 @@ class Command(BaseCommand):
             nargs='?',
             help='Retailer slug to scrape (omit to run all)',
         )
+        parser.add_argument(
+            '--batch-size',
+            type=positive_int,
+            help='Items saved per database batch (default: SCRAPER_BATCH_SIZE)',
+        )
+        parser.add_argument(
+            '--parallel',
+            type=positive_int,
+            default=1,
+            help='Retailers to scrape at the same time (default: 1; keep at 1 on SQLite)',
+        )
 
     def handle(self, *args, **options):
         retailer_slug = options.get('retailer')
+        verbosity = options['verbosity']
 
         if retailer_slug:
             scrapers = {retailer_slug: SCRAPER_REGISTRY.get(retailer_slug)}
@@ -33,16 +59,60 @@ class Command(BaseCommand):
         else:
             scrapers = SCRAPER_REGISTRY
 
-        for slug, scraper_class in scrapers.items():
+        batch_size = options['batch_size']
+        if options['parallel'] == 1:
+            # Stay on this thread so the scrape shares the caller's DB connection
+            for slug, scraper_class in scrapers.items():
+                try:
+                    job = self._run_scraper(slug, scraper_class, batch_size, verbosity)
+                except Exception as exc:
+                    self._report_failure(slug, exc)
+                else:
+                    self._report(slug, job, verbosity)
+            return
+
+        # Each retailer is a different host, so their scrapes are independent
+        # and their politeness delays can overlap.
+        with ThreadPoolExecutor(max_workers=options['parallel']) as pool:
+            futures = {
+                pool.submit(self._run_in_thread, slug, scraper_class, batch_size, verbosity): slug
+                for slug, scraper_class in scrapers.items()
+            }
+
+            for future in as_completed(futures):
+                slug = futures[future]
+                try:
+                    job = future.result()
+                except Exception as exc:
+                    self._report_failure(slug, exc)
+                else:
+                    self._report(slug, job, verbosity)
+
+    def _run_scraper(self, slug, scraper_class, batch_size, verbosity):
+        """Run one scraper and return its ScrapeJob."""
+        if verbosity >= 2:
             self.stdout.write(f'Running scraper: {slug}...')
-            try:
-                scraper = scraper_class()
-                job = scraper.run()
-                self.stdout.write(self.style.SUCCESS(
-                    f'  {slug}: {job.status} — '
-                    f'{job.products_found} found, {job.prices_updated} updated'
-                ))
-                if job.errors:
-                    self.stderr.write(f'  Errors:\n{job.errors}')
-            except Exception as exc:
-                self.stderr.write(self.style.ERROR(f'  {slug} failed: {exc}'))
+        scraper = scraper_class()
+        if batch_size:
+            scraper.batch_size = batch_size
+        return scraper.run()
+
+    def _run_in_thread(self, *args):
+        """Run one scraper on a pool thread."""
+        try:
+            return self._run_scraper(*args)
+        finally:
+            # Worker threads get their own DB connections; don't leak them
+            connections.close_all()
+
+    def _report(self, slug, job, verbosity):
+        if verbosity >= 1:
+            self.stdout.write(self.style.SUCCESS(
+                f'  {slug}: {job.status} — '
+                f'{job.products_found} found, {job.prices_updated} updated'
+            ))
+        if job.errors:
+            self.stderr.write(f'  Errors:\n{job.errors}')
+
+    def _report_failure(self, slug, exc):
+        self.stderr.write(self.style.ERROR(f'  {slug} failed: {exc}'))
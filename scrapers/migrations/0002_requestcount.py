@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-16 12:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('scrapers', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RequestCount',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('retailer_slug', models.SlugField()),
+                ('day', models.DateField()),
+                ('count', models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                'unique_together': {('retailer_slug', 'day')},
+            },
+        ),
+    ]
@@ -26,3 +26,16 @@ class ScrapeJob(models.Model):
 
     def __str__(self):
         return f"{self.retailer.name} scrape — {self.status} ({self.created_at:%Y-%m-%d %H:%M})"
+
+
+class RequestCount(models.Model):
+    """Requests sent to a retailer on one day, for SCRAPER_DAILY_REQUEST_LIMIT."""
+    retailer_slug = models.SlugField()
+    day = models.DateField()
+    count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        unique_together = ('retailer_slug', 'day')
+
+    def __str__(self):
+        return f"{self.retailer_slug} {self.day:%Y-%m-%d}: {self.count} requests"
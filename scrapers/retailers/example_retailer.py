@@ -8,21 +8,50 @@ To add a new retailer:
 4. Register the scraper in SCRAPER_REGISTRY (scrapers/registry.py)
 """
 
+import re
+
+import soupsieve as sv
+from bs4 import SoupStrainer
+
 from scrapers.base import BaseScraper
 
+# Compile CSS selectors once at import instead of on every page
+CARD_SELECTOR = sv.compile('.product-card')
+TITLE_SELECTORS = (sv.compile('h1.product-title'), sv.compile('.title'))
+PRICE_SELECTORS = (sv.compile('.price--sale'), sv.compile('.price'))
+
+# Only build the parts of each page we read. Strainers see the raw class
+# attribute, so match the class as a whole word.
+LISTING_STRAINER = SoupStrainer(class_=re.compile(r'(^|\s)product-card(\s|$)'))
+PRODUCT_STRAINER = SoupStrainer(['h1', 'meta', 'script'])
+
 
 class ExampleRetailerScraper(BaseScraper):
     retailer_slug = 'example-store'
 
     def scrape_products(self):
         # Example: scrape a product listing page
-        # response = self.session.get('https://example-store.com/warhammer')
-        # soup = BeautifulSoup(response.text, 'html.parser')
-        # for card in soup.select('.product-card'):
+        # html = self.fetch('https://example-store.com/warhammer')
+        # if html is None:
+        #     return
+        # soup = self.soup(html, parse_only=LISTING_STRAINER)
+        # for card in CARD_SELECTOR.select(soup):
         #     yield {
-        #         'name': card.select_one('.title').text.strip(),
-        #         'price': card.select_one('.price').text.strip('$'),
+        #         'name': self.select_first(card, TITLE_SELECTORS).text.strip(),
+        #         'price': self.select_first(card, PRICE_SELECTORS).text,
         #         'url': card.select_one('a')['href'],
         #         'in_stock': 'out-of-stock' not in card.get('class', []),
         #     }
+        #
+        # When every product needs its own page, fetch them concurrently and
+        # handle each one as soon as it arrives:
+        # for url, html in self.iter_pages(product_urls):
+        #     if html is None:
+        #         continue
+        #     soup = self.soup(html, parse_only=PRODUCT_STRAINER)  # parse each page once
+        #     for node in self.iter_ld_json(soup, contains='"Product"'):
+        #         if node.get('@type') == 'Product':
+        #             sku = node.get('sku') or node.get('productID')
+        #             offers = node.get('offers') or {}
+        #             ...
         return iter([])  # placeholder — yields nothing
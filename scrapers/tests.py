@@ -0,0 +1,148 @@
+import threading
+import time
+from decimal import Decimal
+
+from django.test import SimpleTestCase, TestCase
+
+from products.models import Product
+
+from .base import BaseScraper
+from .throttle import TokenBucket
+
+
+class ParsePriceTests(SimpleTestCase):
+    def test_parses_price_text(self):
+        cases = {
+            '$1,049.99': Decimal('1049.99'),
+            '£30': Decimal('30.00'),
+            '12.5': Decimal('12.50'),
+            '1,000': Decimal('1000.00'),
+            '12.345': Decimal('12.35'),
+            'Sale - $30': Decimal('30.00'),
+        }
+        for value, expected in cases.items():
+            with self.subTest(value=value):
+                self.assertEqual(BaseScraper.parse_price(value), expected)
+
+    def test_parses_floats_exactly(self):
+        self.assertEqual(BaseScraper.parse_price(30.0), Decimal('30.00'))
+        self.assertEqual(BaseScraper.parse_price(19.995), Decimal('20.00'))
+        self.assertEqual(BaseScraper.parse_price(1e-05), Decimal('0.00'))
+
+    def test_parses_numbers(self):
+        self.assertEqual(BaseScraper.parse_price(30), Decimal('30.00'))
+        self.assertEqual(BaseScraper.parse_price(Decimal('12.345')), Decimal('12.35'))
+        self.assertEqual(BaseScraper.parse_price(Decimal('1E+2')), Decimal('100.00'))
+        self.assertEqual(BaseScraper.parse_price(1e2), Decimal('100.00'))
+
+    def test_rejects_negative_numbers(self):
+        for value in (Decimal('-5'), -5, -5.0):
+            with self.subTest(value=value):
+                with self.assertRaisesMessage(ValueError, 'Negative price'):
+                    BaseScraper.parse_price(value)
+
+    def test_rejects_negative_text(self):
+        for value in ('-5.00', '-$5', '$-5'):
+            with self.subTest(value=value):
+                with self.assertRaises(ValueError):
+                    BaseScraper.parse_price(value)
+
+    def test_rejects_decimal_comma(self):
+        for value in ('30,00 €', '1.049,99 €'):
+            with self.subTest(value=value):
+                with self.assertRaises(ValueError):
+                    BaseScraper.parse_price(value)
+
+    def test_rejects_space_thousands_separators(self):
+        for value in ('1 049,99 €', '1\xa0049.99', '1\u202f049,99 €'):
+            with self.subTest(value=value):
+                with self.assertRaises(ValueError):
+                    BaseScraper.parse_price(value)
+
+    def test_rejects_text_without_a_number(self):
+        with self.assertRaises(ValueError):
+            BaseScraper.parse_price('abc')
+
+
+class CleanItemTests(SimpleTestCase):
+    def clean(self, **overrides):
+        item = {'name': 'Intercessors', 'sku': '48-75', 'price': '50', 'url': 'https://example.com/1'}
+        return BaseScraper._clean_item({**item, **overrides})
+
+    def test_accepts_values_that_fit_their_columns(self):
+        self.assertEqual(self.clean(price='999999.99')['price'], Decimal('999999.99'))
+
+    def test_rejects_values_too_large_for_their_columns(self):
+        cases = {
+            'price': '1000000',
+            'url': 'https://example.com/' + 'x' * 200,
+            'name': 'x' * 301,
+            'sku': 'x' * 51,
+        }
+        for key, value in cases.items():
+            with self.subTest(key=key):
+                with self.assertRaises(ValueError):
+                    self.clean(**{key: value})
+
+
+class MatchProductsTests(TestCase):
+    def match(self, *items):
+        scraper = BaseScraper()
+        scraper._load_product_index()
+        return scraper._match_products([
+            BaseScraper._clean_item({'name': name, 'sku': sku, 'price': '10', 'url': 'https://example.com'})
+            for name, sku in items
+        ])
+
+    def test_matches_existing_products_by_sku_then_name(self):
+        by_sku = Product.objects.create(name='Intercessors', slug='intercessors', gw_sku='48-75')
+        by_name = Product.objects.create(name='Space Marine Captain', slug='space-marine-captain')
+        products = self.match(('Intercessors (box)', '48-75'), ('space  marine\ncaptain', ''))
+        self.assertEqual(products, [by_sku, by_name])
+        self.assertEqual(Product.objects.count(), 2)
+
+    def test_listings_sharing_a_new_sku_create_one_product(self):
+        first, second = self.match(('Foo', 'X'), ('Foo Box', 'X'))
+        self.assertEqual(first, second)
+        self.assertEqual(Product.objects.filter(gw_sku='X').count(), 1)
+
+    def test_unsluggable_names_stay_distinct(self):
+        first, second = self.match(('★', ''), ('☆', ''))
+        self.assertNotEqual(first, second)
+        self.assertEqual(Product.objects.count(), 2)
+
+
+class TokenBucketTests(SimpleTestCase):
+    def acquire_times(self, bucket, callers, pause=None):
+        start = time.monotonic()
+        times = []
+
+        def worker():
+            bucket.acquire()
+            times.append(time.monotonic() - start)
+
+        threads = [threading.Thread(target=worker) for _ in range(callers)]
+        for thread in threads:
+            thread.start()
+        if pause:
+            time.sleep(pause[0])
+            bucket.pause(pause[1])
+        for thread in threads:
+            thread.join()
+        return sorted(times)
+
+    def assertSpaced(self, times, after, gap):
+        self.assertGreaterEqual(times[0], after)
+        for earlier, later in zip(times, times[1:]):
+            self.assertGreaterEqual(later - earlier, gap)
+
+    def test_callers_stay_spaced_after_a_pause(self):
+        bucket = TokenBucket(rate=10)
+        bucket.pause(0.3)
+        self.assertSpaced(self.acquire_times(bucket, 4), after=0.3, gap=0.08)
+
+    def test_pause_holds_back_callers_already_waiting(self):
+        bucket = TokenBucket(rate=10)
+        times = self.acquire_times(bucket, 4, pause=(0.05, 0.3))
+        self.assertLess(times[0], 0.05)
+        self.assertSpaced(times[1:], after=0.35, gap=0.08)
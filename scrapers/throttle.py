@@ -0,0 +1,120 @@
+"""
+Request throttling shared by a scraper's fetch threads.
+"""
+
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    Rate limiter allowing `rate` requests per second, with bursts of up to
+    `capacity` requests after an idle spell.
+
+    Thread-safe, so every worker fetching from a host shares one bucket and
+    adding workers never raises the request rate. A rate of 0 disables the
+    limit.
+    """
+
+    def __init__(self, rate, capacity=1):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._resume_at = 0.0
+        self._paused_total = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now):
+        # _updated runs ahead of the clock during a pause; no refill until then
+        if now > self._updated:
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+
+    def acquire(self):
+        """Block until the caller may send its next request."""
+        with self._lock:
+            now = time.monotonic()
+            at = max(now, self._resume_at)
+            if self.rate:
+                self._refill(now)
+                # Tokens may go negative: that's callers queued for future slots
+                self._tokens -= 1
+                if self._tokens < 0:
+                    at = max(at, self._updated - self._tokens / self.rate)
+            paused = self._paused_total
+
+        while True:
+            wait = at - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+            # A pause that began while we waited pushes our slot back too
+            with self._lock:
+                shift = self._paused_total - paused
+                paused = self._paused_total
+            if shift <= 0:
+                return
+            at += shift
+
+    def pause(self, seconds):
+        """
+        Hold back every caller for `seconds`, e.g. after a Retry-After.
+
+        Requests resume at the normal spacing once the pause ends, instead of
+        all queued callers firing at once.
+        """
+        with self._lock:
+            now = time.monotonic()
+            resume_at = max(self._resume_at, now + seconds)
+            self._paused_total += resume_at - max(self._resume_at, now)
+            self._resume_at = resume_at
+            if self.rate:
+                self._refill(now)
+                self._tokens = min(self._tokens, 0)
+                self._updated = resume_at
+
+
+class CircuitBreaker:
+    """
+    Stops sending requests to a host that keeps failing.
+
+    After `threshold` consecutive failures the circuit opens and allow()
+    refuses requests for `cooldown` seconds. Then a single probe is let
+    through: success closes the circuit again, failure re-opens it.
+    """
+
+    def __init__(self, threshold, cooldown):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self._failures = 0
+        self._opened_at = None
+        self._probing = False
+        self._lock = threading.Lock()
+
+    def allow(self):
+        """Return True if a request may be sent now."""
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if self._probing or time.monotonic() - self._opened_at < self.cooldown:
+                return False
+            self._probing = True
+            return True
+
+    def release(self):
+        """Give back a probe that allow() granted but that was never sent."""
+        with self._lock:
+            self._probing = False
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._probing = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._probing or self._failures >= self.threshold:
+                self._opened_at = time.monotonic()
+                self._probing = False
@@ -6,6 +6,7 @@ import os
 from pathlib import Path
 
 import dj_database_url
+from django.core.exceptions import ImproperlyConfigured
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -111,4 +112,21 @@ SCRAPER_USER_AGENT = os.environ.get(
     'SCRAPER_USER_AGENT',
     'Thrifthammer/1.0 (Warhammer Price Tracker)'
 )
-SCRAPER_REQUEST_DELAY = int(os.environ.get('SCRAPER_REQUEST_DELAY', '2'))
+SCRAPER_REQUEST_DELAY = float(os.environ.get('SCRAPER_REQUEST_DELAY', '2'))
+# Requests a host may receive back-to-back before SCRAPER_REQUEST_DELAY spacing applies
+SCRAPER_REQUEST_BURST = int(os.environ.get('SCRAPER_REQUEST_BURST', '1'))
+SCRAPER_REQUEST_TIMEOUT = int(os.environ.get('SCRAPER_REQUEST_TIMEOUT', '15'))
+# Pages longer than this are cut short instead of read in full (0 = no cap)
+SCRAPER_MAX_RESPONSE_BYTES = int(os.environ.get('SCRAPER_MAX_RESPONSE_BYTES', str(2 * 1024 * 1024)))
+SCRAPER_MAX_WORKERS = int(os.environ.get('SCRAPER_MAX_WORKERS', '4'))
+SCRAPER_MAX_RETRIES = int(os.environ.get('SCRAPER_MAX_RETRIES', '3'))
+SCRAPER_MAX_BACKOFF = int(os.environ.get('SCRAPER_MAX_BACKOFF', '30'))
+# Scraped items saved per transaction, and rows per bulk INSERT/UPDATE
+SCRAPER_BATCH_SIZE = int(os.environ.get('SCRAPER_BATCH_SIZE', '100'))
+if SCRAPER_BATCH_SIZE < 1:
+    raise ImproperlyConfigured('SCRAPER_BATCH_SIZE must be at least 1')
+# Per-retailer cap on requests per day, counted in the database (0 = unlimited)
+SCRAPER_DAILY_REQUEST_LIMIT = int(os.environ.get('SCRAPER_DAILY_REQUEST_LIMIT', '0'))
+# Directory for conditional-GET page caching (empty disables it)
+SCRAPER_HTTP_CACHE_DIR = os.environ.get('SCRAPER_HTTP_CACHE_DIR', '')
+SCRAPER_RESPECT_ROBOTS = os.environ.get('SCRAPER_RESPECT_ROBOTS', 'True').lower() in ('true', '1', 'yes')